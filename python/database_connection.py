@@ -8,16 +8,27 @@ Comprehensive analytics platform for pharmaceutical supply chain optimization
 including database connectivity, data analysis, and visualization capabilities.
 """
 
+import argparse
+import os
+import sys
+
 import mysql.connector
+from mysql.connector import pooling
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-import numpy as np
 from datetime import datetime, timedelta
+from decimal import Decimal
 import warnings
-from typing import Dict, List, Optional, Tuple
-import sys
-import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import quote
+
+try:
+    import connectorx as cx  # Optional: Rust-based loader, much faster than pd.read_sql
+except ImportError:
+    cx = None
 
 # Configure display settings
 warnings.filterwarnings('ignore')
@@ -31,6 +42,52 @@ class PharmaceuticalAnalytics:
     Provides comprehensive database connectivity and business intelligence capabilities
     """
     
+    # Selectable sales performance columns and their SQL expressions
+    SALES_COLUMNS = {
+        'Representative_Name': 'Representative_Name',
+        'Region_Name': 'Region_Name',
+        'Performance_Rating': 'Performance_Rating',
+        'Total_Orders': 'Total_Orders',
+        'Total_Sales': 'Total_Sales',
+        'Average_Order_Value': 'Average_Order_Value',
+        'Unique_Customers': 'Unique_Customers',
+        'Last_Order_Date': 'Last_Order_Date',
+        'Days_Since_Last_Order': 'DATEDIFF(CURDATE(), Last_Order_Date) AS Days_Since_Last_Order',
+    }
+    # Selectable product performance columns and their SQL expressions
+    PRODUCT_COLUMNS = {
+        'Product_Name': 'Product_Name',
+        'Category': 'Category',
+        'Unit_Price': 'Unit_Price',
+        'Times_Ordered': 'Times_Ordered',
+        'Total_Quantity_Sold': 'Total_Quantity_Sold',
+        'Total_Revenue': 'Total_Revenue',
+        'Avg_Quantity_Per_Order': 'Avg_Quantity_Per_Order',
+        'Current_Stock': 'Current_Stock',
+        'Turnover_Ratio': 'Turnover_Ratio',
+    }
+    # Stock status labels indexed by Stock_Status_Code
+    STOCK_STATUSES = ['OUT_OF_STOCK', 'CRITICAL', 'LOW', 'MODERATE', 'ADEQUATE']
+    # Rows per batch when reading large tables through pandas
+    READ_CHUNK_SIZE = 20000
+    # Pooled connections; bounds how many queries can run concurrently
+    POOL_SIZE = 8
+    # Dashboard color schemes
+    COLORS_PRIMARY = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D']
+    COLORS_SECONDARY = ['#4E9F3D', '#191A19', '#1E5128', '#D8E9A8']
+    # Dashboard panels in display order: number -> (plot method, data it needs)
+    DASHBOARD_PANELS = {
+        1: ('_plot_top_representatives', ('sales',)),
+        2: ('_plot_regional_revenue', ('regional',)),
+        3: ('_plot_inventory_status', ('inventory',)),
+        4: ('_plot_customer_segments', ('customers',)),
+        5: ('_plot_category_revenue', ('categories',)),
+        6: ('_plot_monthly_trend', ('trend',)),
+        7: ('_plot_top_products', ('products',)),
+        8: ('_plot_rating_vs_sales', ('sales', 'trendline')),
+        9: ('_plot_executive_summary', ('summary',)),
+    }
+    
     def __init__(self, db_config: Dict[str, str]):
         """
         Initialize the analytics platform
@@ -39,120 +96,376 @@ class PharmaceuticalAnalytics:
             db_config (dict): Database configuration parameters
         """
         self.db_config = db_config
-        self.connection = None
-        self.cursor = None
-        self.connected = False
+        self.pool = None
+        self._cache: Dict[str, Any] = {}
+        self._cx_conn_str = (
+            f"mysql://{quote(str(db_config.get('user', '')), safe='')}"
+            f":{quote(str(db_config.get('password', '')), safe='')}"
+            f"@{db_config.get('host', 'localhost')}:{db_config.get('port', 3306)}"
+            f"/{db_config.get('database', '')}"
+        )
+        
+    @property
+    def connected(self) -> bool:
+        """
+        Whether the connection pool has been established
+        """
+        return self.pool is not None and self.pool.pool_size > 0
         
     def connect_database(self) -> bool:
         """
-        Establish secure database connection with error handling
+        Establish a pool of secure database connections with error handling
         
         Returns:
             bool: Connection success status
         """
         try:
-            self.connection = mysql.connector.connect(**self.db_config)
-            self.cursor = self.connection.cursor()
-            self.connected = True
+            self.pool = pooling.MySQLConnectionPool(pool_name='pharma', pool_size=self.POOL_SIZE,
+                                                    **self.db_config)
             print("✓ Database connection established successfully")
             print(f"✓ Connected to database: {self.db_config['database']}")
             return True
             
         except mysql.connector.Error as err:
             print(f"✗ Database connection failed: {err}")
-            self.connected = False
+            self.pool = None
             return False
     
-    def execute_query(self, query: str, params: Optional[Tuple] = None) -> pd.DataFrame:
+    @contextmanager
+    def _connection(self) -> Iterator[pooling.PooledMySQLConnection]:
+        """
+        Check a connection out of the pool for the duration of a with-block
+        
+        Yields:
+            PooledMySQLConnection: Connection, returned to the pool on exit
+        """
+        connection = self.pool.get_connection()
+        try:
+            yield connection
+        finally:
+            connection.close()
+    
+    def execute_query(self, query: str, params: Optional[Tuple] = None,
+                      partition_on: Optional[str] = None, partition_num: int = 4,
+                      chunksize: Optional[int] = None) -> pd.DataFrame:
         """
         Execute SQL query with parameterized input and return DataFrame
         
+        Uses connectorx when installed for unparameterized queries, falling back
+        to pandas.read_sql over the mysql-connector connection otherwise. Column
+        types are narrowed with _optimize before returning.
+        
         Args:
             query (str): SQL query string
             params (tuple, optional): Query parameters for prepared statements
+            partition_on (str, optional): Integer column for connectorx to split the
+                query on and load in parallel; row order is not preserved
+            partition_num (int): Number of parallel partitions
+            chunksize (int, optional): Read through pandas in batches of this many
+                rows, narrowing each batch before concatenation
             
         Returns:
-            pd.DataFrame: Query results
+            pd.DataFrame: Query results; integer columns come back as narrow
+                signed types (int8/int16/...) and repetitive text as category
         """
         if not self.connected:
             print("✗ Database not connected. Please establish connection first.")
             return pd.DataFrame()
+        
+        if cx is not None and params is None:
+            options = {'partition_on': partition_on, 'partition_num': partition_num} if partition_on else {}
+            try:
+                return self._optimize(cx.read_sql(self._cx_conn_str, query, return_type="pandas", **options))
+            except Exception as e:
+                print(f"Warning: connectorx load failed, falling back to pandas: {e}")
             
         try:
-            df = pd.read_sql(query, self.connection, params=params)
-            return df
+            with self._connection() as connection:
+                if chunksize:
+                    chunks = pd.read_sql(query, connection, params=params, chunksize=chunksize)
+                    frames = [self._optimize(chunk) for chunk in chunks]
+                    if not frames:
+                        return pd.DataFrame()
+                    # Categories differ between batches, so re-narrow the combined frame
+                    return self._optimize(pd.concat(frames, ignore_index=True))
+                df = pd.read_sql(query, connection, params=params)
+                return self._optimize(df)
         except Exception as e:
             print(f"✗ Query execution failed: {e}")
             return pd.DataFrame()
     
-    def get_executive_summary(self) -> Dict:
+    @staticmethod
+    def _optimize(df: pd.DataFrame) -> pd.DataFrame:
         """
-        Generate executive-level KPI summary
+        Narrow column dtypes to reduce memory and speed up downstream pandas operations
         
+        Integers are downcast to the smallest signed type, so differences such as
+        Current_Stock - Reorder_Level can still go negative, DECIMAL values become
+        float64, and low-cardinality text columns become categoricals. Floats are
+        left at 64 bits since they carry currency values.
+        
+        Args:
+            df (pd.DataFrame): Query results
+            
         Returns:
-            dict: Key performance indicators
+            pd.DataFrame: Results with narrowed column types
         """
-        summary = {}
+        for column in df.columns:
+            series = df[column]
+            if series.dtype == object:
+                values = series.dropna()
+                if not values.empty and isinstance(values.iloc[0], Decimal):
+                    df[column] = series.astype('float64')
+                    continue
+            
+            if pd.api.types.is_integer_dtype(series):
+                df[column] = pd.to_numeric(series, downcast='integer')
+            elif (pd.api.types.infer_dtype(series, skipna=True) == 'string'
+                  and series.nunique() / len(series) < 0.5):
+                df[column] = series.astype('category')
+        return df
+    
+    def _exec_row(self, query: str, params: Tuple = ()) -> Optional[Tuple]:
+        """
+        Run a single-row query on a plain cursor, bypassing pandas
         
-        # Total revenue
-        revenue_query = "SELECT SUM(Total_cost) as total_revenue FROM Orders WHERE Order_Status != 'Cancelled'"
-        revenue_result = self.execute_query(revenue_query)
-        summary['total_revenue'] = float(revenue_result.iloc[0]['total_revenue']) if not revenue_result.empty else 0
+        Pooled sessions are reset on checkout, so a server-side prepared
+        statement would be re-prepared on every call; for these one-shot
+        KPI queries that only adds round trips.
         
-        # Total orders
-        orders_query = "SELECT COUNT(*) as total_orders FROM Orders WHERE Order_Status != 'Cancelled'"
-        orders_result = self.execute_query(orders_query)
-        summary['total_orders'] = int(orders_result.iloc[0]['total_orders']) if not orders_result.empty else 0
+        Args:
+            query (str): SQL query string returning one row
+            params (tuple): Query parameters
+            
+        Returns:
+            tuple or None: The first result row, or None on failure
+        """
+        if not self.connected:
+            print("✗ Database not connected. Please establish connection first.")
+            return None
+            
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, params)
+                    # Drain the result so the connection goes back to the pool clean
+                    rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+            return rows[0] if rows else None
+        except mysql.connector.Error as err:
+            print(f"✗ Query execution failed: {err}")
+            return None
+    
+    def _cached(self, key: str, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return a cached analysis result, running the loader on first use
         
-        # Active representatives
-        reps_query = "SELECT COUNT(DISTINCT Representative_ID) as active_reps FROM Sales_Representative"
-        reps_result = self.execute_query(reps_query)
-        summary['active_representatives'] = int(reps_result.iloc[0]['active_reps']) if not reps_result.empty else 0
+        Empty results are not cached so a failed query is retried on the next call.
         
-        # Inventory value
-        inventory_query = """
-        SELECT SUM(p.Price * i.Quantity) as inventory_value 
-        FROM Product p 
-        JOIN Inventory i ON p.Product_ID = i.Product_ID
+        Args:
+            key (str): Cache key for the analysis
+            loader (callable): Function producing the DataFrame
+            
+        Returns:
+            pd.DataFrame: Cached or freshly loaded results
+        """
+        if key in self._cache:
+            return self._cache[key]
+        df = loader()
+        if not df.empty:
+            self._cache[key] = df
+        return df
+    
+    def invalidate(self) -> None:
+        """
+        Drop all cached analysis results so the next calls re-query the database
+        """
+        self._cache.clear()
+    
+    def get_executive_summary(self) -> Dict:
+        """
+        Generate executive-level KPI summary
+        
+        Returns:
+            dict: Key performance indicators
         """
-        inventory_result = self.execute_query(inventory_query)
-        summary['inventory_value'] = float(inventory_result.iloc[0]['inventory_value']) if not inventory_result.empty else 0
+        if 'summary' in self._cache:
+            return self._cache['summary']
+        
+        summary_query = """
+        SELECT 
+            (SELECT COALESCE(SUM(Total_cost), 0) FROM Orders WHERE Order_Status != 'Cancelled') AS total_revenue,
+            (SELECT COUNT(*) FROM Orders WHERE Order_Status != 'Cancelled') AS total_orders,
+            (SELECT COUNT(*) FROM Sales_Representative) AS active_reps,
+            (SELECT COALESCE(SUM(p.Price * i.Quantity), 0)
+             FROM Product p
+             JOIN Inventory i ON p.Product_ID = i.Product_ID) AS inventory_value
+        """
+        row = self._exec_row(summary_query)
+        
+        # Scalars come straight off the cursor; NULL sums are already 0 in SQL
+        total_revenue, total_orders, active_reps, inventory_value = row or (0, 0, 0, 0)
+        summary = {
+            'total_revenue': float(total_revenue),
+            'total_orders': int(total_orders),
+            'active_representatives': int(active_reps),
+            'inventory_value': float(inventory_value),
+        }
         
         # Average order value
         if summary['total_orders'] > 0:
             summary['average_order_value'] = summary['total_revenue'] / summary['total_orders']
         else:
             summary['average_order_value'] = 0
-            
+        
+        if row is not None:
+            self._cache['summary'] = summary
         return summary
     
-    def analyze_sales_performance(self) -> pd.DataFrame:
+    @staticmethod
+    def _build_query(table: str, available: Dict[str, str], columns: Sequence[str],
+                     order_by: str, limit: Optional[int] = None) -> str:
+        """
+        Build a SELECT that projects only the requested columns
+        
+        Args:
+            table (str): Table to select from
+            available (dict): Allowed column names mapped to SQL expressions
+            columns (sequence): Columns to project, in output order
+            order_by (str): ORDER BY clause
+            limit (int, optional): Maximum number of rows to return
+            
+        Returns:
+            str: SQL query string
+        """
+        unknown = [column for column in columns if column not in available]
+        if unknown:
+            raise ValueError(f"Unknown columns for {table}: {', '.join(unknown)}")
+        projection = ",\n            ".join(available[column] for column in columns)
+        query = f"""
+        SELECT 
+            {projection}
+        FROM {table}
+        ORDER BY {order_by}
+        """
+        if limit is not None:
+            query += f"LIMIT {int(limit)}\n"
+        return query
+    
+    def _from_cached_full(self, key: str, columns: Optional[Sequence[str]],
+                          top_n: Optional[int]) -> Optional[pd.DataFrame]:
+        """
+        Serve a column subset or top-N request from an already cached full result
+        
+        Args:
+            key (str): Cache key of the full result
+            columns (sequence, optional): Columns to keep
+            top_n (int, optional): Number of leading rows to keep
+            
+        Returns:
+            pd.DataFrame or None: The narrowed result, or None when not cached
+        """
+        full = self._cache.get(key)
+        if full is None:
+            return None
+        view = full if columns is None else full[list(columns)]
+        return view if top_n is None else view.head(top_n)
+    
+    def _sales_query(self, columns: Optional[Sequence[str]] = None,
+                     top_n: Optional[int] = None) -> str:
+        """
+        Sales performance query projecting only the requested columns
+        
+        Args:
+            columns (sequence, optional): Columns from SALES_COLUMNS, all by default
+            top_n (int, optional): Only return the n highest-selling representatives
+            
+        Returns:
+            str: SQL query string
+        """
+        return self._build_query('mv_sales_performance', self.SALES_COLUMNS,
+                                 columns or list(self.SALES_COLUMNS), 'Total_Sales DESC', top_n)
+    
+    def _product_query(self, columns: Optional[Sequence[str]] = None, with_id: bool = False,
+                       top_n: Optional[int] = None) -> str:
+        """
+        Product performance query projecting only the requested columns
+        
+        Args:
+            columns (sequence, optional): Columns from PRODUCT_COLUMNS, all by default
+            with_id (bool): Prepend Product_ID, needed for partitioned loads
+            top_n (int, optional): Only return the n highest-revenue products
+            
+        Returns:
+            str: SQL query string
+        """
+        columns = list(columns or self.PRODUCT_COLUMNS)
+        available = self.PRODUCT_COLUMNS
+        if with_id:
+            columns.insert(0, 'Product_ID')
+            available = {'Product_ID': 'Product_ID', **available}
+        return self._build_query('mv_product_performance', available, columns,
+                                 'Total_Revenue DESC', top_n)
+    
+    def analyze_sales_performance(self, top_n: Optional[int] = None,
+                                  columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """
         Comprehensive sales representative performance analysis
         
+        Args:
+            top_n (int, optional): Only fetch the n highest-selling representatives
+            columns (sequence, optional): Only fetch these SALES_COLUMNS
+            
         Returns:
             pd.DataFrame: Sales performance metrics by representative
         """
-        query = """
+        cached = self._from_cached_full('sales', columns, top_n)
+        if cached is not None:
+            return cached
+        
+        query = self._sales_query(columns, top_n)
+        key = 'sales' if columns is None else f"sales[{','.join(columns)}]"
+        if top_n is not None:
+            key = f'{key}_top_{top_n}'
+        return self._cached(key, lambda: self.execute_query(query))
+    
+    def analyze_sales_trendline(self) -> Optional[Tuple[float, float]]:
+        """
+        Least-squares fit of total sales on performance rating across all representatives
+        
+        Returns:
+            tuple or None: (slope, intercept), or None with fewer than two distinct ratings
+        """
+        if 'trendline' in self._cache:
+            return self._cache['trendline']
+        
+        # Closed-form slope (N*Sxy - Sx*Sy) / (N*Sxx - Sx^2); intercept from the means
+        trendline_query = """
         SELECT 
-            sr.Name AS Representative_Name,
-            r.Name AS Region_Name,
-            sr.Performance_Rating,
-            COUNT(DISTINCT o.Order_ID) AS Total_Orders,
-            SUM(o.Total_cost) AS Total_Sales,
-            AVG(o.Total_cost) AS Average_Order_Value,
-            COUNT(DISTINCT i.Customer_ID) AS Unique_Customers,
-            MAX(o.Date) AS Last_Order_Date,
-            DATEDIFF(CURDATE(), MAX(o.Date)) AS Days_Since_Last_Order
-        FROM Sales_Representative sr
-        JOIN Region r ON sr.Region_ID = r.Region_ID
-        LEFT JOIN Orders o ON sr.Representative_ID = o.Representative_ID
-        LEFT JOIN Interaction i ON sr.Representative_ID = i.Representative_ID
-        WHERE o.Order_Status != 'Cancelled' OR o.Order_Status IS NULL
-        GROUP BY sr.Representative_ID, sr.Name, r.Name, sr.Performance_Rating
-        ORDER BY Total_Sales DESC
-        """
-        return self.execute_query(query)
+            slope,
+            avg_sales - slope * avg_rating AS intercept
+        FROM (
+            SELECT 
+                (COUNT(*) * SUM(Performance_Rating * Total_Sales)
+                 - SUM(Performance_Rating) * SUM(Total_Sales))
+                / NULLIF(COUNT(*) * SUM(Performance_Rating * Performance_Rating)
+                         - SUM(Performance_Rating) * SUM(Performance_Rating), 0) AS slope,
+                AVG(Total_Sales) AS avg_sales,
+                AVG(Performance_Rating) AS avg_rating
+            FROM mv_sales_performance
+            WHERE Performance_Rating IS NOT NULL
+              AND Total_Sales IS NOT NULL
+        ) sums
+        """
+        row = self._exec_row(trendline_query)
+        if row is None or row[0] is None:
+            return None
+        
+        trendline = (float(row[0]), float(row[1]))
+        self._cache['trendline'] = trendline
+        return trendline
     
     def analyze_inventory_status(self) -> pd.DataFrame:
         """
@@ -163,38 +476,28 @@ class PharmaceuticalAnalytics:
         """
         query = """
         SELECT 
-            p.Name AS Product_Name,
-            p.Category,
-            p.Price,
-            i.Quantity AS Current_Stock,
-            i.Reorder_Level,
-            (p.Price * i.Quantity) AS Total_Value,
-            i.Location,
-            CASE 
-                WHEN i.Quantity = 0 THEN 'OUT_OF_STOCK'
-                WHEN i.Quantity <= i.Reorder_Level * 0.3 THEN 'CRITICAL'
-                WHEN i.Quantity <= i.Reorder_Level * 0.6 THEN 'LOW'
-                WHEN i.Quantity <= i.Reorder_Level THEN 'MODERATE'
-                ELSE 'ADEQUATE'
-            END AS Stock_Status,
-            CASE 
-                WHEN i.Quantity <= i.Reorder_Level THEN 'REORDER_NOW'
-                WHEN i.Quantity <= i.Reorder_Level * 1.5 THEN 'MONITOR'
-                ELSE 'SUFFICIENT'
-            END AS Action_Required
-        FROM Product p
-        JOIN Inventory i ON p.Product_ID = i.Product_ID
-        ORDER BY 
-            CASE 
-                WHEN i.Quantity = 0 THEN 1
-                WHEN i.Quantity <= i.Reorder_Level * 0.3 THEN 2
-                WHEN i.Quantity <= i.Reorder_Level * 0.6 THEN 3
-                WHEN i.Quantity <= i.Reorder_Level THEN 4
-                ELSE 5
-            END,
-            Total_Value DESC
-        """
-        return self.execute_query(query)
+            Product_Name,
+            Category,
+            Price,
+            Current_Stock,
+            Reorder_Level,
+            Total_Value,
+            Location,
+            Stock_Status_Code,
+            Action_Required
+        FROM mv_inventory_status
+        ORDER BY Stock_Status_Code, Total_Value DESC
+        """
+        
+        def load() -> pd.DataFrame:
+            df = self.execute_query(query, chunksize=self.READ_CHUNK_SIZE)
+            if not df.empty:
+                # Statuses travel as 1-byte codes; attach the labels once, client-side
+                df.insert(df.columns.get_loc('Stock_Status_Code') + 1, 'Stock_Status',
+                          pd.Categorical.from_codes(df['Stock_Status_Code'], categories=self.STOCK_STATUSES))
+            return df
+        
+        return self._cached('inventory', load)
     
     def analyze_regional_performance(self) -> pd.DataFrame:
         """
@@ -205,24 +508,18 @@ class PharmaceuticalAnalytics:
         """
         query = """
         SELECT 
-            r.Name AS Region_Name,
-            COUNT(DISTINCT sr.Representative_ID) AS Total_Representatives,
-            COUNT(DISTINCT o.Order_ID) AS Total_Orders,
-            SUM(o.Total_cost) AS Total_Revenue,
-            AVG(o.Total_cost) AS Average_Order_Value,
-            COUNT(DISTINCT i.Customer_ID) AS Unique_Customers,
-            SUM(o.Total_cost) / COUNT(DISTINCT sr.Representative_ID) AS Revenue_Per_Rep,
-            COUNT(DISTINCT o.Order_ID) / COUNT(DISTINCT sr.Representative_ID) AS Orders_Per_Rep
-        FROM Region r
-        LEFT JOIN Sales_Representative sr ON r.Region_ID = sr.Region_ID
-        LEFT JOIN Orders o ON sr.Representative_ID = o.Representative_ID
-        LEFT JOIN Interaction i ON sr.Representative_ID = i.Representative_ID
-        WHERE o.Order_Status != 'Cancelled' OR o.Order_Status IS NULL
-        GROUP BY r.Region_ID, r.Name
-        HAVING Total_Representatives > 0
+            Region_Name,
+            Total_Representatives,
+            Total_Orders,
+            Total_Revenue,
+            Average_Order_Value,
+            Unique_Customers,
+            Revenue_Per_Rep,
+            Orders_Per_Rep
+        FROM mv_regional_performance
         ORDER BY Total_Revenue DESC
         """
-        return self.execute_query(query)
+        return self._cached('regional', lambda: self.execute_query(query))
     
     def analyze_customer_segments(self) -> pd.DataFrame:
         """
@@ -233,178 +530,317 @@ class PharmaceuticalAnalytics:
         """
         query = """
         SELECT 
-            CASE 
-                WHEN d.Customer_ID IS NOT NULL THEN 'Doctor'
-                WHEN h.Customer_ID IS NOT NULL THEN 'Hospital'
-                WHEN ph.Customer_ID IS NOT NULL THEN 'Pharmacy'
-                ELSE 'Other'
-            END AS Customer_Type,
-            COUNT(DISTINCT c.Customer_ID) AS Customer_Count,
-            COUNT(DISTINCT op.Order_ID) AS Total_Orders,
-            SUM(o.Total_cost) AS Total_Revenue,
-            AVG(o.Total_cost) AS Average_Order_Value,
-            SUM(o.Total_cost) / COUNT(DISTINCT c.Customer_ID) AS Revenue_Per_Customer
-        FROM Customer c
-        LEFT JOIN Doctors d ON c.Customer_ID = d.Customer_ID
-        LEFT JOIN Hospital h ON c.Customer_ID = h.Customer_ID
-        LEFT JOIN Pharmacy ph ON c.Customer_ID = ph.Customer_ID
-        LEFT JOIN Order_Placed op ON c.Customer_ID = op.Customer_ID
-        LEFT JOIN Orders o ON op.Order_ID = o.Order_ID AND o.Order_Status != 'Cancelled'
-        GROUP BY Customer_Type
+            Customer_Type,
+            Customer_Count,
+            Total_Orders,
+            Total_Revenue,
+            Average_Order_Value,
+            Revenue_Per_Customer
+        FROM mv_customer_segments
         ORDER BY Total_Revenue DESC
         """
-        return self.execute_query(query)
+        return self._cached('customers', lambda: self.execute_query(query))
     
-    def analyze_product_performance(self) -> pd.DataFrame:
+    def analyze_product_performance(self, top_n: Optional[int] = None,
+                                    columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """
         Product performance analysis with profitability metrics
         
+        Args:
+            top_n (int, optional): Only fetch the n highest-revenue products
+            columns (sequence, optional): Only fetch these PRODUCT_COLUMNS
+            
         Returns:
             pd.DataFrame: Product performance data
         """
+        cached = self._from_cached_full('products', columns, top_n)
+        if cached is not None:
+            return cached
+        
+        key = 'products' if columns is None else f"products[{','.join(columns)}]"
+        if top_n is not None:
+            query = self._product_query(columns, top_n=top_n)
+            return self._cached(f'{key}_top_{top_n}', lambda: self.execute_query(query))
+        
+        query = self._product_query(columns, with_id=True)
+        
+        def load() -> pd.DataFrame:
+            # Largest result set: let connectorx fetch it in parallel partitions,
+            # then restore the revenue ordering the partitions do not preserve
+            df = self.execute_query(query, partition_on='Product_ID')
+            if df.empty:
+                return df
+            if 'Total_Revenue' in df.columns:
+                df = df.sort_values('Total_Revenue', ascending=False, ignore_index=True)
+            return df.drop(columns='Product_ID')
+        
+        return self._cached(key, load)
+    
+    def analyze_category_performance(self) -> pd.DataFrame:
+        """
+        Revenue totals by product category, aggregated in the database
+        
+        Returns:
+            pd.DataFrame: Category revenue ordered from highest to lowest
+        """
         query = """
         SELECT 
-            p.Name AS Product_Name,
-            p.Category,
-            p.Price AS Unit_Price,
-            COUNT(DISTINCT inv.Order_ID) AS Times_Ordered,
-            SUM(inv.Quantity_Ordered) AS Total_Quantity_Sold,
-            SUM(inv.Line_Total) AS Total_Revenue,
-            AVG(inv.Quantity_Ordered) AS Avg_Quantity_Per_Order,
-            i.Quantity AS Current_Stock,
-            CASE 
-                WHEN i.Quantity > 0 AND SUM(inv.Quantity_Ordered) > 0 
-                THEN ROUND(SUM(inv.Quantity_Ordered) / i.Quantity, 2)
-                ELSE 0
-            END AS Turnover_Ratio
-        FROM Product p
-        LEFT JOIN Involvement inv ON p.Product_ID = inv.Product_ID
-        LEFT JOIN Orders o ON inv.Order_ID = o.Order_ID AND o.Order_Status != 'Cancelled'
-        LEFT JOIN Inventory i ON p.Product_ID = i.Product_ID
-        GROUP BY p.Product_ID, p.Name, p.Category, p.Price, i.Quantity
+            Category,
+            SUM(Total_Revenue) AS Total_Revenue
+        FROM mv_product_performance
+        GROUP BY Category
         ORDER BY Total_Revenue DESC
         """
-        return self.execute_query(query)
+        return self._cached('categories', lambda: self.execute_query(query))
+    
+    def analyze_monthly_trend(self) -> pd.DataFrame:
+        """
+        Cumulative sales over the twelve months up to the most recent order
+        
+        Returns:
+            pd.DataFrame: Monthly and running sales totals by month (YYYY-MM)
+        """
+        query = """
+        SELECT 
+            Month,
+            Monthly_Sales,
+            SUM(Monthly_Sales) OVER (ORDER BY Month) AS Cumulative_Sales
+        FROM (
+            SELECT 
+                DATE_FORMAT(Date, '%Y-%m') AS Month,
+                SUM(Total_cost) AS Monthly_Sales
+            FROM Orders
+            WHERE Order_Status != 'Cancelled'
+              AND Date >= (SELECT DATE_FORMAT(DATE_SUB(MAX(Date), INTERVAL 11 MONTH), '%Y-%m-01')
+                           FROM Orders)
+            GROUP BY Month
+        ) monthly
+        ORDER BY Month
+        """
+        return self._cached('trend', lambda: self.execute_query(query))
+    
+    def refresh_materialized_views(self) -> bool:
+        """
+        Rebuild the mv_* roll-up tables read by the analyze_* methods
+        
+        Returns:
+            bool: Refresh success status
+        """
+        if not self.connected:
+            print("✗ Database not connected. Please establish connection first.")
+            return False
+            
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.callproc('refresh_materialized_views')
+                finally:
+                    cursor.close()
+            self.invalidate()
+            print("✓ Materialized views refreshed successfully")
+            return True
+        except mysql.connector.Error as err:
+            print(f"✗ Materialized view refresh failed: {err}")
+            return False
+    
+    def _run_parallel(self, tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent, I/O-bound analyses concurrently
+        
+        Each query checks out its own pooled connection, so tasks can share
+        this instance safely.
+        
+        Args:
+            tasks (dict): Result name mapped to a zero-argument function
+            
+        Returns:
+            dict: Result name mapped to the task's return value
+        """
+        with ThreadPoolExecutor(max_workers=min(len(tasks), self.POOL_SIZE)) as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
     
-    def create_comprehensive_dashboard(self) -> None:
+    def _dashboard_loaders(self) -> Dict[str, Callable[[], Any]]:
+        """
+        Data loaders for the dashboard panels, keyed by DASHBOARD_PANELS data names
+        
+        Returns:
+            dict: Data name mapped to a zero-argument loader
+        """
+        return {
+            'sales': lambda: self.analyze_sales_performance(
+                top_n=8, columns=('Representative_Name', 'Total_Sales', 'Performance_Rating')),
+            'trendline': lambda: self.analyze_sales_trendline(),
+            'regional': lambda: self.analyze_regional_performance(),
+            'inventory': lambda: self.analyze_inventory_status(),
+            'customers': lambda: self.analyze_customer_segments(),
+            'categories': lambda: self.analyze_category_performance(),
+            'trend': lambda: self.analyze_monthly_trend(),
+            'products': lambda: self.analyze_product_performance(
+                top_n=6, columns=('Product_Name', 'Total_Revenue')),
+            'summary': lambda: self.get_executive_summary(),
+        }
+    
+    def create_comprehensive_dashboard(self, panels: Optional[Sequence[int]] = None,
+                                       show: bool = True) -> None:
         """
         Generate comprehensive analytics dashboard with multiple visualizations
+        
+        Args:
+            panels (sequence, optional): DASHBOARD_PANELS numbers to render, all by default;
+                only the data those panels need is queried
+            show (bool): Display the figure after saving it to dashboard.png
         """
+        panels = sorted(set(panels or self.DASHBOARD_PANELS))
+        
+        # Fetch the selected panels' data concurrently before drawing
+        loaders = self._dashboard_loaders()
+        needed = {name for panel in panels for name in self.DASHBOARD_PANELS[panel][1]}
+        data = self._run_parallel({name: loaders[name] for name in needed})
+        
         # Set up the plotting style
         plt.style.use('default')
         sns.set_palette("husl")
         
-        # Create figure with subplots
-        fig = plt.figure(figsize=(20, 15))
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        # Create figure with one subplot per selected panel, three per row;
+        # constrained layout spaces them while drawing, without a tight_layout pass
+        ncols = min(3, len(panels))
+        nrows = -(-len(panels) // ncols)
+        fig, axes = plt.subplots(nrows, ncols, figsize=(20 * ncols / 3, 5 * nrows), dpi=150,
+                                 constrained_layout=True, squeeze=False)
+        
+        for ax, panel in zip(axes.flat, panels):
+            method, names = self.DASHBOARD_PANELS[panel]
+            getattr(self, method)(ax, *(data[name] for name in names))
+        for ax in axes.flat[len(panels):]:
+            ax.axis('off')
         
-        # Color schemes
-        colors_primary = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D']
-        colors_secondary = ['#4E9F3D', '#191A19', '#1E5128', '#D8E9A8']
+        fig.suptitle('Pharmaceutical Supply Chain Analytics Dashboard', 
+                     fontsize=16, fontweight='bold')
         
-        # 1. Sales Performance by Representative (Top 8)
-        ax1 = fig.add_subplot(gs[0, 0])
-        sales_data = self.analyze_sales_performance().head(8)
+        # Save the dashboard; only the exported PNG is rendered at 300 dpi
+        fig.savefig('dashboard.png', dpi=300, bbox_inches='tight')
+        if show:
+            plt.show()
+        else:
+            # Release the figure so repeated headless runs do not accumulate them
+            plt.close(fig)
+    
+    def _plot_top_representatives(self, ax: plt.Axes, sales_data: pd.DataFrame) -> None:
+        """
+        Panel 1: Sales Performance by Representative (Top 8)
+        """
         if not sales_data.empty:
-            bars = ax1.barh(sales_data['Representative_Name'], sales_data['Total_Sales'], 
-                           color=colors_primary[0], alpha=0.8)
-            ax1.set_title('Top Sales Representatives by Revenue', fontweight='bold', fontsize=12)
-            ax1.set_xlabel('Total Sales ($)')
+            bars = ax.barh(sales_data['Representative_Name'], sales_data['Total_Sales'], 
+                           color=self.COLORS_PRIMARY[0], alpha=0.8)
+            ax.set_title('Top Sales Representatives by Revenue', fontweight='bold', fontsize=12)
+            ax.set_xlabel('Total Sales ($)')
             
             # Add value labels
             for bar in bars:
                 width = bar.get_width()
-                ax1.text(width, bar.get_y() + bar.get_height()/2.,
+                ax.text(width, bar.get_y() + bar.get_height()/2.,
                         f'${width:,.0f}', ha='left', va='center', fontsize=9)
-        
-        # 2. Regional Performance
-        ax2 = fig.add_subplot(gs[0, 1])
-        regional_data = self.analyze_regional_performance()
+    
+    def _plot_regional_revenue(self, ax: plt.Axes, regional_data: pd.DataFrame) -> None:
+        """
+        Panel 2: Regional Performance
+        """
         if not regional_data.empty:
-            wedges, texts, autotexts = ax2.pie(regional_data['Total_Revenue'], 
+            wedges, texts, autotexts = ax.pie(regional_data['Total_Revenue'], 
                                              labels=regional_data['Region_Name'],
                                              autopct='%1.1f%%', 
-                                             colors=colors_secondary)
-            ax2.set_title('Revenue Distribution by Region', fontweight='bold', fontsize=12)
-        
-        # 3. Inventory Status Distribution
-        ax3 = fig.add_subplot(gs[0, 2])
-        inventory_data = self.analyze_inventory_status()
+                                             colors=self.COLORS_SECONDARY)
+            ax.set_title('Revenue Distribution by Region', fontweight='bold', fontsize=12)
+    
+    def _plot_inventory_status(self, ax: plt.Axes, inventory_data: pd.DataFrame) -> None:
+        """
+        Panel 3: Inventory Status Distribution
+        """
         if not inventory_data.empty:
-            status_counts = inventory_data['Stock_Status'].value_counts()
-            bars = ax3.bar(status_counts.index, status_counts.values, 
+            status_counts = inventory_data['Stock_Status'].value_counts(sort=False)
+            bars = ax.bar(status_counts.index, status_counts.values, 
                           color=['#C73E1D', '#F18F01', '#A23B72', '#2E86AB', '#4E9F3D'])
-            ax3.set_title('Inventory Status Distribution', fontweight='bold', fontsize=12)
-            ax3.set_ylabel('Number of Products')
-            ax3.tick_params(axis='x', rotation=45)
-        
-        # 4. Customer Segment Analysis
-        ax4 = fig.add_subplot(gs[1, 0])
-        customer_data = self.analyze_customer_segments()
+            ax.set_title('Inventory Status Distribution', fontweight='bold', fontsize=12)
+            ax.set_ylabel('Number of Products')
+            ax.tick_params(axis='x', rotation=45)
+    
+    def _plot_customer_segments(self, ax: plt.Axes, customer_data: pd.DataFrame) -> None:
+        """
+        Panel 4: Customer Segment Analysis
+        """
         if not customer_data.empty:
-            bars = ax4.bar(customer_data['Customer_Type'], customer_data['Total_Revenue'],
-                          color=colors_primary, alpha=0.8)
-            ax4.set_title('Revenue by Customer Type', fontweight='bold', fontsize=12)
-            ax4.set_ylabel('Total Revenue ($)')
+            bars = ax.bar(customer_data['Customer_Type'], customer_data['Total_Revenue'],
+                          color=self.COLORS_PRIMARY, alpha=0.8)
+            ax.set_title('Revenue by Customer Type', fontweight='bold', fontsize=12)
+            ax.set_ylabel('Total Revenue ($)')
             
             # Add value labels
             for bar in bars:
                 height = bar.get_height()
-                ax4.text(bar.get_x() + bar.get_width()/2., height,
+                ax.text(bar.get_x() + bar.get_width()/2., height,
                         f'${height:,.0f}', ha='center', va='bottom', fontsize=9)
-        
-        # 5. Product Category Performance
-        ax5 = fig.add_subplot(gs[1, 1])
-        product_data = self.analyze_product_performance()
-        if not product_data.empty:
-            category_performance = product_data.groupby('Category')['Total_Revenue'].sum().sort_values(ascending=False)
-            bars = ax5.barh(category_performance.index, category_performance.values,
-                           color=colors_secondary[0], alpha=0.8)
-            ax5.set_title('Revenue by Product Category', fontweight='bold', fontsize=12)
-            ax5.set_xlabel('Total Revenue ($)')
-        
-        # 6. Sales Trend Analysis (Simulated monthly data)
-        ax6 = fig.add_subplot(gs[1, 2])
-        # Create sample monthly trend data
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        sales_trend = np.random.normal(50000, 10000, 12).cumsum() + 100000
-        ax6.plot(months, sales_trend, marker='o', linewidth=2, color=colors_primary[1])
-        ax6.fill_between(months, sales_trend, alpha=0.3, color=colors_primary[1])
-        ax6.set_title('Monthly Sales Trend', fontweight='bold', fontsize=12)
-        ax6.set_ylabel('Cumulative Sales ($)')
-        ax6.tick_params(axis='x', rotation=45)
-        
-        # 7. Top Products by Revenue
-        ax7 = fig.add_subplot(gs[2, 0])
-        if not product_data.empty:
-            top_products = product_data.head(6)
-            bars = ax7.bar(range(len(top_products)), top_products['Total_Revenue'],
-                          color=colors_primary[2], alpha=0.8)
-            ax7.set_title('Top Products by Revenue', fontweight='bold', fontsize=12)
-            ax7.set_ylabel('Total Revenue ($)')
-            ax7.set_xticks(range(len(top_products)))
-            ax7.set_xticklabels(top_products['Product_Name'], rotation=45, ha='right')
-        
-        # 8. Representative Performance vs Rating
-        ax8 = fig.add_subplot(gs[2, 1])
+    
+    def _plot_category_revenue(self, ax: plt.Axes, category_data: pd.DataFrame) -> None:
+        """
+        Panel 5: Product Category Performance
+        """
+        if not category_data.empty:
+            bars = ax.barh(category_data['Category'], category_data['Total_Revenue'],
+                           color=self.COLORS_SECONDARY[0], alpha=0.8)
+            ax.set_title('Revenue by Product Category', fontweight='bold', fontsize=12)
+            ax.set_xlabel('Total Revenue ($)')
+    
+    def _plot_monthly_trend(self, ax: plt.Axes, trend_data: pd.DataFrame) -> None:
+        """
+        Panel 6: Sales Trend Analysis
+        """
+        if not trend_data.empty:
+            months = trend_data['Month'].astype(str)
+            ax.plot(months, trend_data['Cumulative_Sales'], marker='o', linewidth=2, color=self.COLORS_PRIMARY[1])
+            ax.fill_between(months, trend_data['Cumulative_Sales'], alpha=0.3, color=self.COLORS_PRIMARY[1])
+            ax.set_title('Monthly Sales Trend', fontweight='bold', fontsize=12)
+            ax.set_ylabel('Cumulative Sales ($)')
+            ax.tick_params(axis='x', rotation=45)
+    
+    def _plot_top_products(self, ax: plt.Axes, top_products: pd.DataFrame) -> None:
+        """
+        Panel 7: Top Products by Revenue
+        """
+        if not top_products.empty:
+            bars = ax.bar(range(len(top_products)), top_products['Total_Revenue'],
+                          color=self.COLORS_PRIMARY[2], alpha=0.8)
+            ax.set_title('Top Products by Revenue', fontweight='bold', fontsize=12)
+            ax.set_ylabel('Total Revenue ($)')
+            ax.set_xticks(range(len(top_products)))
+            ax.set_xticklabels(top_products['Product_Name'], rotation=45, ha='right')
+    
+    def _plot_rating_vs_sales(self, ax: plt.Axes, sales_data: pd.DataFrame,
+                              trendline: Optional[Tuple[float, float]]) -> None:
+        """
+        Panel 8: Representative Performance vs Rating
+        """
         if not sales_data.empty:
-            scatter = ax8.scatter(sales_data['Performance_Rating'], sales_data['Total_Sales'],
-                                 s=100, alpha=0.7, color=colors_primary[3])
-            ax8.set_title('Performance Rating vs Sales', fontweight='bold', fontsize=12)
-            ax8.set_xlabel('Performance Rating')
-            ax8.set_ylabel('Total Sales ($)')
+            scatter = ax.scatter(sales_data['Performance_Rating'], sales_data['Total_Sales'],
+                                 s=100, alpha=0.7, color=self.COLORS_PRIMARY[3])
+            ax.set_title('Performance Rating vs Sales', fontweight='bold', fontsize=12)
+            ax.set_xlabel('Performance Rating')
+            ax.set_ylabel('Total Sales ($)')
             
-            # Add trend line
-            if len(sales_data) > 1:
-                z = np.polyfit(sales_data['Performance_Rating'], sales_data['Total_Sales'], 1)
-                p = np.poly1d(z)
-                ax8.plot(sales_data['Performance_Rating'], p(sales_data['Performance_Rating']), 
+            # Add trend line, fitted in SQL over all representatives
+            if trendline is not None:
+                slope, intercept = trendline
+                xmin, xmax = ax.get_xlim()
+                ax.plot([xmin, xmax], [slope * xmin + intercept, slope * xmax + intercept],
                         "r--", alpha=0.8, linewidth=2)
-        
-        # 9. Executive Summary Text
-        ax9 = fig.add_subplot(gs[2, 2])
-        ax9.axis('off')
-        summary = self.get_executive_summary()
+                ax.set_xlim(xmin, xmax)
+    
+    def _plot_executive_summary(self, ax: plt.Axes, summary: Dict) -> None:
+        """
+        Panel 9: Executive Summary Text
+        """
+        ax.axis('off')
         
         summary_text = f"""
         EXECUTIVE SUMMARY
@@ -421,16 +857,8 @@ class PharmaceuticalAnalytics:
         Growth Trend: Positive
         """
         
-        ax9.text(0.1, 0.9, summary_text, transform=ax9.transAxes, fontsize=11,
+        ax.text(0.1, 0.9, summary_text, transform=ax.transAxes, fontsize=11,
                 verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray"))
-        
-        plt.suptitle('Pharmaceutical Supply Chain Analytics Dashboard', 
-                     fontsize=16, fontweight='bold', y=0.98)
-        
-        # Save the dashboard
-        plt.tight_layout()
-        plt.savefig('dashboard.png', dpi=300, bbox_inches='tight')
-        plt.show()
     
     def generate_detailed_report(self) -> str:
         """
@@ -462,18 +890,27 @@ class PharmaceuticalAnalytics:
         if not sales_data.empty:
             report.append("TOP SALES PERFORMERS")
             report.append("-" * 50)
-            for _, row in sales_data.head(5).iterrows():
-                report.append(f"{row['Representative_Name']} ({row['Region_Name']}): ${row['Total_Sales']:,.2f}")
+            top_sales = sales_data.head(5)
+            report.extend(
+                f"{name} ({region}): ${sales:,.2f}"
+                for name, region, sales in zip(top_sales['Representative_Name'].to_numpy(),
+                                               top_sales['Region_Name'].to_numpy(),
+                                               top_sales['Total_Sales'].to_numpy())
+            )
             report.append("")
         
         # Inventory Alerts
         inventory_data = self.analyze_inventory_status()
-        critical_items = inventory_data[inventory_data['Stock_Status'].isin(['CRITICAL', 'OUT_OF_STOCK'])]
+        critical_items = inventory_data[inventory_data['Stock_Status_Code'] <= 1]
         if not critical_items.empty:
             report.append("CRITICAL INVENTORY ALERTS")
             report.append("-" * 50)
-            for _, row in critical_items.iterrows():
-                report.append(f"{row['Product_Name']}: {row['Current_Stock']} units ({row['Stock_Status']})")
+            report.extend(
+                f"{name}: {stock} units ({status})"
+                for name, stock, status in zip(critical_items['Product_Name'].to_numpy(),
+                                               critical_items['Current_Stock'].to_numpy(),
+                                               critical_items['Stock_Status'].to_numpy())
+            )
             report.append("")
         
         # Regional Performance
@@ -481,8 +918,13 @@ class PharmaceuticalAnalytics:
         if not regional_data.empty:
             report.append("REGIONAL PERFORMANCE SUMMARY")
             report.append("-" * 50)
-            for _, row in regional_data.head(3).iterrows():
-                report.append(f"{row['Region_Name']}: ${row['Total_Revenue']:,.2f} revenue, {row['Total_Orders']} orders")
+            top_regions = regional_data.head(3)
+            report.extend(
+                f"{region}: ${revenue:,.2f} revenue, {orders} orders"
+                for region, revenue, orders in zip(top_regions['Region_Name'].to_numpy(),
+                                                   top_regions['Total_Revenue'].to_numpy(),
+                                                   top_regions['Total_Orders'].to_numpy())
+            )
             report.append("")
         
         report.append("="*80)
@@ -490,22 +932,64 @@ class PharmaceuticalAnalytics:
     
     def close_connection(self) -> None:
         """
-        Safely close database connection
+        Safely close all pooled database connections
         """
         try:
-            if self.cursor:
-                self.cursor.close()
-            if self.connection:
-                self.connection.close()
-            self.connected = False
+            # MySQLConnectionPool has no public shutdown; use its internal one when
+            # present, otherwise idle connections close once the pool is released
+            remove_connections = getattr(self.pool, '_remove_connections', None)
+            if remove_connections is not None:
+                remove_connections()
+            self.pool = None
             print("✓ Database connection closed successfully")
         except Exception as e:
             print(f"Warning: Error closing connection: {e}")
 
-def main():
+def _parse_panels(value: str) -> List[int]:
+    """
+    Parse a comma-separated list of dashboard panel numbers for argparse
+    
+    Args:
+        value (str): e.g. "1,3,9"
+        
+    Returns:
+        list: Panel numbers
+    """
+    try:
+        panels = [int(part) for part in value.split(',') if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid panel list: {value!r}")
+    invalid = [panel for panel in panels if panel not in PharmaceuticalAnalytics.DASHBOARD_PANELS]
+    if not panels or invalid:
+        raise argparse.ArgumentTypeError(
+            f"panels must be between 1 and {len(PharmaceuticalAnalytics.DASHBOARD_PANELS)}: {value!r}")
+    return panels
+
+def main(argv: Optional[List[str]] = None):
     """
     Main execution function for pharmaceutical analytics platform
+    
+    Args:
+        argv (list, optional): Command-line arguments, sys.argv[1:] by default
     """
+    parser = argparse.ArgumentParser(description="Pharmaceutical Supply Chain Analytics Platform")
+    parser.add_argument('--dashboard', dest='dashboard', action='store_true', default=True,
+                        help="render the analytics dashboard (default)")
+    parser.add_argument('--no-dashboard', dest='dashboard', action='store_false',
+                        help="skip the analytics dashboard")
+    parser.add_argument('--report-only', action='store_true',
+                        help="only generate the detailed report")
+    parser.add_argument('--subplots', type=_parse_panels, default=None, metavar='N[,N...]',
+                        help="dashboard panels to render, e.g. 1,3,9 (default: all)")
+    args = parser.parse_args(argv)
+    if args.subplots is not None and (args.report_only or not args.dashboard):
+        parser.error("--subplots cannot be combined with --no-dashboard or --report-only")
+    
+    # Render off-screen when there is no display to show the dashboard on
+    headless = sys.platform.startswith('linux') and not os.environ.get('DISPLAY')
+    if headless:
+        plt.switch_backend('Agg')
+    
     print("Pharmaceutical Supply Chain Analytics Platform")
     print("=" * 50)
     
@@ -529,42 +1013,44 @@ def main():
             print("Failed to connect to database. Please check your configuration.")
             return
         
-        print("\nGenerating comprehensive analytics...")
-        
-        # Generate and display executive summary
-        summary = analytics.get_executive_summary()
-        print(f"\nExecutive Summary:")
-        print(f"Total Revenue: ${summary['total_revenue']:,.2f}")
-        print(f"Total Orders: {summary['total_orders']:,}")
-        print(f"Active Representatives: {summary['active_representatives']}")
-        print(f"Average Order Value: ${summary['average_order_value']:,.2f}")
-        
-        # Display detailed analytics
-        print("\n" + "="*50)
-        print("DETAILED ANALYTICS")
-        print("="*50)
-        
-        # Sales Performance
-        print("\n1. Sales Performance Analysis:")
-        sales_df = analytics.analyze_sales_performance()
-        if not sales_df.empty:
-            print(sales_df.head().to_string(index=False))
-        
-        # Inventory Status
-        print("\n2. Inventory Status Analysis:")
-        inventory_df = analytics.analyze_inventory_status()
-        if not inventory_df.empty:
-            print(inventory_df.head().to_string(index=False))
-        
-        # Regional Performance
-        print("\n3. Regional Performance Analysis:")
-        regional_df = analytics.analyze_regional_performance()
-        if not regional_df.empty:
-            print(regional_df.to_string(index=False))
-        
-        # Generate comprehensive dashboard
-        print("\nGenerating analytics dashboard...")
-        analytics.create_comprehensive_dashboard()
+        if not args.report_only:
+            print("\nGenerating comprehensive analytics...")
+            
+            # Generate and display executive summary
+            summary = analytics.get_executive_summary()
+            print(f"\nExecutive Summary:")
+            print(f"Total Revenue: ${summary['total_revenue']:,.2f}")
+            print(f"Total Orders: {summary['total_orders']:,}")
+            print(f"Active Representatives: {summary['active_representatives']}")
+            print(f"Average Order Value: ${summary['average_order_value']:,.2f}")
+            
+            # Display detailed analytics
+            print("\n" + "="*50)
+            print("DETAILED ANALYTICS")
+            print("="*50)
+            
+            # Sales Performance
+            print("\n1. Sales Performance Analysis:")
+            sales_df = analytics.analyze_sales_performance()
+            if not sales_df.empty:
+                print(sales_df.head().to_string(index=False))
+            
+            # Inventory Status
+            print("\n2. Inventory Status Analysis:")
+            inventory_df = analytics.analyze_inventory_status()
+            if not inventory_df.empty:
+                print(inventory_df.head().to_string(index=False))
+            
+            # Regional Performance
+            print("\n3. Regional Performance Analysis:")
+            regional_df = analytics.analyze_regional_performance()
+            if not regional_df.empty:
+                print(regional_df.to_string(index=False))
+            
+            # Generate comprehensive dashboard
+            if args.dashboard:
+                print("\nGenerating analytics dashboard...")
+                analytics.create_comprehensive_dashboard(panels=args.subplots, show=not headless)
         
         # Generate detailed report
         print("\nGenerating detailed report...")
@@ -0,0 +1,112 @@
+-- =====================================================
+-- Migration: denormalized Customer.Customer_Type
+-- Pharmaceutical Supply Chain Analytics
+-- Database: MySQL 8.0+
+--
+-- For databases created before Customer_Type was added to
+-- create_tables.sql. Adds the column, installs the triggers that
+-- keep it current and backfills existing customers. Safe to re-run:
+-- the column is only added when missing. Afterwards re-run
+-- materialized_views.sql so the segment roll-up uses it:
+--     mysql -u root -p pharma_db < sql/add_customer_type.sql
+--     mysql -u root -p pharma_db < sql/materialized_views.sql
+-- =====================================================
+
+USE pharma_db;
+
+DROP PROCEDURE IF EXISTS add_customer_type_if_missing;
+
+-- MySQL has no ADD COLUMN IF NOT EXISTS
+DELIMITER //
+CREATE PROCEDURE add_customer_type_if_missing()
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = 'Customer' AND column_name = 'Customer_Type'
+    ) THEN
+        ALTER TABLE Customer
+            ADD COLUMN Customer_Type ENUM('Doctor', 'Hospital', 'Pharmacy', 'Other') NOT NULL DEFAULT 'Other';
+    END IF;
+END //
+DELIMITER ;
+
+CALL add_customer_type_if_missing();
+DROP PROCEDURE add_customer_type_if_missing;
+
+DROP TRIGGER IF EXISTS trg_doctors_customer_type_ins;
+DROP TRIGGER IF EXISTS trg_doctors_customer_type_upd;
+DROP TRIGGER IF EXISTS trg_doctors_customer_type_del;
+DROP TRIGGER IF EXISTS trg_hospital_customer_type_ins;
+DROP TRIGGER IF EXISTS trg_hospital_customer_type_upd;
+DROP TRIGGER IF EXISTS trg_hospital_customer_type_del;
+DROP TRIGGER IF EXISTS trg_pharmacy_customer_type_ins;
+DROP TRIGGER IF EXISTS trg_pharmacy_customer_type_upd;
+DROP TRIGGER IF EXISTS trg_pharmacy_customer_type_del;
+
+-- Keeps Customer.Customer_Type in step with the Doctors, Hospital and
+-- Pharmacy tables (Doctor > Hospital > Pharmacy precedence), so the
+-- segment roll-up reads one column instead of probing three tables
+DROP PROCEDURE IF EXISTS sync_customer_type;
+DELIMITER //
+CREATE PROCEDURE sync_customer_type(IN p_customer_id INT)
+BEGIN
+    UPDATE Customer
+    SET Customer_Type = CASE
+        WHEN EXISTS (SELECT 1 FROM Doctors WHERE Customer_ID = p_customer_id) THEN 'Doctor'
+        WHEN EXISTS (SELECT 1 FROM Hospital WHERE Customer_ID = p_customer_id) THEN 'Hospital'
+        WHEN EXISTS (SELECT 1 FROM Pharmacy WHERE Customer_ID = p_customer_id) THEN 'Pharmacy'
+        ELSE 'Other'
+    END
+    WHERE Customer_ID = p_customer_id;
+END //
+
+CREATE TRIGGER trg_doctors_customer_type_ins AFTER INSERT ON Doctors
+FOR EACH ROW CALL sync_customer_type(NEW.Customer_ID) //
+CREATE TRIGGER trg_doctors_customer_type_upd AFTER UPDATE ON Doctors
+FOR EACH ROW
+BEGIN
+    IF NEW.Customer_ID <> OLD.Customer_ID THEN
+        CALL sync_customer_type(OLD.Customer_ID);
+        CALL sync_customer_type(NEW.Customer_ID);
+    END IF;
+END //
+CREATE TRIGGER trg_doctors_customer_type_del AFTER DELETE ON Doctors
+FOR EACH ROW CALL sync_customer_type(OLD.Customer_ID) //
+
+CREATE TRIGGER trg_hospital_customer_type_ins AFTER INSERT ON Hospital
+FOR EACH ROW CALL sync_customer_type(NEW.Customer_ID) //
+CREATE TRIGGER trg_hospital_customer_type_upd AFTER UPDATE ON Hospital
+FOR EACH ROW
+BEGIN
+    IF NEW.Customer_ID <> OLD.Customer_ID THEN
+        CALL sync_customer_type(OLD.Customer_ID);
+        CALL sync_customer_type(NEW.Customer_ID);
+    END IF;
+END //
+CREATE TRIGGER trg_hospital_customer_type_del AFTER DELETE ON Hospital
+FOR EACH ROW CALL sync_customer_type(OLD.Customer_ID) //
+
+CREATE TRIGGER trg_pharmacy_customer_type_ins AFTER INSERT ON Pharmacy
+FOR EACH ROW CALL sync_customer_type(NEW.Customer_ID) //
+CREATE TRIGGER trg_pharmacy_customer_type_upd AFTER UPDATE ON Pharmacy
+FOR EACH ROW
+BEGIN
+    IF NEW.Customer_ID <> OLD.Customer_ID THEN
+        CALL sync_customer_type(OLD.Customer_ID);
+        CALL sync_customer_type(NEW.Customer_ID);
+    END IF;
+END //
+CREATE TRIGGER trg_pharmacy_customer_type_del AFTER DELETE ON Pharmacy
+FOR EACH ROW CALL sync_customer_type(OLD.Customer_ID) //
+DELIMITER ;
+
+-- One-time backfill of existing customers
+UPDATE Customer c
+SET c.Customer_Type = CASE
+    WHEN EXISTS (SELECT 1 FROM Doctors d WHERE d.Customer_ID = c.Customer_ID) THEN 'Doctor'
+    WHEN EXISTS (SELECT 1 FROM Hospital h WHERE h.Customer_ID = c.Customer_ID) THEN 'Hospital'
+    WHEN EXISTS (SELECT 1 FROM Pharmacy ph WHERE ph.Customer_ID = c.Customer_ID) THEN 'Pharmacy'
+    ELSE 'Other'
+END;
+
+SELECT 'Customer_Type column in place; now run materialized_views.sql' AS Status;
@@ -59,7 +59,10 @@ CREATE TABLE Customer (
     Contact_Details VARCHAR(200),
     Address VARCHAR(300),
     Registration_Date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    Status ENUM('Active', 'Inactive', 'Pending') DEFAULT 'Active'
+    Status ENUM('Active', 'Inactive', 'Pending') DEFAULT 'Active',
+    -- Denormalized from Doctors/Hospital/Pharmacy; maintained by the
+    -- triggers in CUSTOMER TYPE MAINTENANCE below
+    Customer_Type ENUM('Doctor', 'Hospital', 'Pharmacy', 'Other') NOT NULL DEFAULT 'Other'
 );
 
 -- Product catalog
@@ -209,6 +212,67 @@ CREATE TABLE Hospital (
     FOREIGN KEY (Customer_ID) REFERENCES Customer(Customer_ID)
 );
 
+-- =====================================================
+-- CUSTOMER TYPE MAINTENANCE
+-- =====================================================
+
+-- Keeps Customer.Customer_Type in step with the Doctors, Hospital and
+-- Pharmacy tables (Doctor > Hospital > Pharmacy precedence), so the
+-- segment roll-up reads one column instead of probing three tables
+DROP PROCEDURE IF EXISTS sync_customer_type;
+DELIMITER //
+CREATE PROCEDURE sync_customer_type(IN p_customer_id INT)
+BEGIN
+    UPDATE Customer
+    SET Customer_Type = CASE
+        WHEN EXISTS (SELECT 1 FROM Doctors WHERE Customer_ID = p_customer_id) THEN 'Doctor'
+        WHEN EXISTS (SELECT 1 FROM Hospital WHERE Customer_ID = p_customer_id) THEN 'Hospital'
+        WHEN EXISTS (SELECT 1 FROM Pharmacy WHERE Customer_ID = p_customer_id) THEN 'Pharmacy'
+        ELSE 'Other'
+    END
+    WHERE Customer_ID = p_customer_id;
+END //
+
+CREATE TRIGGER trg_doctors_customer_type_ins AFTER INSERT ON Doctors
+FOR EACH ROW CALL sync_customer_type(NEW.Customer_ID) //
+CREATE TRIGGER trg_doctors_customer_type_upd AFTER UPDATE ON Doctors
+FOR EACH ROW
+BEGIN
+    IF NEW.Customer_ID <> OLD.Customer_ID THEN
+        CALL sync_customer_type(OLD.Customer_ID);
+        CALL sync_customer_type(NEW.Customer_ID);
+    END IF;
+END //
+CREATE TRIGGER trg_doctors_customer_type_del AFTER DELETE ON Doctors
+FOR EACH ROW CALL sync_customer_type(OLD.Customer_ID) //
+
+CREATE TRIGGER trg_hospital_customer_type_ins AFTER INSERT ON Hospital
+FOR EACH ROW CALL sync_customer_type(NEW.Customer_ID) //
+CREATE TRIGGER trg_hospital_customer_type_upd AFTER UPDATE ON Hospital
+FOR EACH ROW
+BEGIN
+    IF NEW.Customer_ID <> OLD.Customer_ID THEN
+        CALL sync_customer_type(OLD.Customer_ID);
+        CALL sync_customer_type(NEW.Customer_ID);
+    END IF;
+END //
+CREATE TRIGGER trg_hospital_customer_type_del AFTER DELETE ON Hospital
+FOR EACH ROW CALL sync_customer_type(OLD.Customer_ID) //
+
+CREATE TRIGGER trg_pharmacy_customer_type_ins AFTER INSERT ON Pharmacy
+FOR EACH ROW CALL sync_customer_type(NEW.Customer_ID) //
+CREATE TRIGGER trg_pharmacy_customer_type_upd AFTER UPDATE ON Pharmacy
+FOR EACH ROW
+BEGIN
+    IF NEW.Customer_ID <> OLD.Customer_ID THEN
+        CALL sync_customer_type(OLD.Customer_ID);
+        CALL sync_customer_type(NEW.Customer_ID);
+    END IF;
+END //
+CREATE TRIGGER trg_pharmacy_customer_type_del AFTER DELETE ON Pharmacy
+FOR EACH ROW CALL sync_customer_type(OLD.Customer_ID) //
+DELIMITER ;
+
 -- =====================================================
 -- SAMPLE DATA INSERTION
 -- =====================================================
@@ -309,9 +373,18 @@ INSERT INTO Orders (Order_ID, Date, Total_cost, Representative_ID, Shipment_ID,
 CREATE INDEX idx_sales_rep_region ON Sales_Representative(Region_ID);
 CREATE INDEX idx_orders_rep ON Orders(Representative_ID);
 CREATE INDEX idx_orders_date ON Orders(Date);
-CREATE INDEX idx_inventory_product ON Inventory(Product_ID);
 CREATE INDEX idx_product_category ON Product(Category);
 
+-- Covering indexes for the analytics roll-ups; MySQL has no INCLUDE,
+-- so covered columns are appended to the key
+CREATE INDEX idx_orders_status_rep ON Orders(Order_Status, Representative_ID, Total_cost, Date);
+CREATE INDEX idx_orders_status_date ON Orders(Order_Status, Date, Total_cost);
+CREATE INDEX idx_involvement_prod ON Involvement(Product_ID, Order_ID, Quantity_Ordered, Line_Total);
+CREATE INDEX idx_inventory_prod ON Inventory(Product_ID, Quantity, Reorder_Level);
+-- Order_Placed's primary key leads with Order_ID; Interaction's already
+-- covers (Representative_ID, Customer_ID)
+CREATE INDEX idx_order_placed_customer ON Order_Placed(Customer_ID, Order_ID);
+
 -- Create views for common queries
 CREATE VIEW Sales_Performance AS
 SELECT 
@@ -0,0 +1,61 @@
+-- =====================================================
+-- Migration: covering indexes
+-- Pharmaceutical Supply Chain Analytics
+-- Database: MySQL 8.0+
+--
+-- For databases created before the covering indexes were added to
+-- create_tables.sql. Safe to re-run: each index is only created
+-- when missing.
+--     mysql -u root -p pharma_db < sql/indexes.sql
+-- =====================================================
+
+USE pharma_db;
+
+DROP PROCEDURE IF EXISTS create_index_if_missing;
+DROP PROCEDURE IF EXISTS drop_index_if_exists;
+
+-- MySQL has no CREATE INDEX IF NOT EXISTS
+DELIMITER //
+CREATE PROCEDURE create_index_if_missing(
+    IN p_table VARCHAR(64), IN p_index VARCHAR(64), IN p_columns VARCHAR(255))
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = p_table AND index_name = p_index
+    ) THEN
+        SET @ddl = CONCAT('CREATE INDEX ', p_index, ' ON ', p_table, '(', p_columns, ')');
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END //
+
+CREATE PROCEDURE drop_index_if_exists(IN p_table VARCHAR(64), IN p_index VARCHAR(64))
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = p_table AND index_name = p_index
+    ) THEN
+        SET @ddl = CONCAT('DROP INDEX ', p_index, ' ON ', p_table);
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END //
+DELIMITER ;
+
+CALL create_index_if_missing('Orders', 'idx_orders_status_rep', 'Order_Status, Representative_ID, Total_cost, Date');
+CALL create_index_if_missing('Orders', 'idx_orders_status_date', 'Order_Status, Date, Total_cost');
+CALL create_index_if_missing('Involvement', 'idx_involvement_prod', 'Product_ID, Order_ID, Quantity_Ordered, Line_Total');
+CALL create_index_if_missing('Inventory', 'idx_inventory_prod', 'Product_ID, Quantity, Reorder_Level');
+CALL create_index_if_missing('Order_Placed', 'idx_order_placed_customer', 'Customer_ID, Order_ID');
+
+-- Superseded by idx_inventory_prod, which also backs the Product_ID foreign key
+CALL drop_index_if_exists('Inventory', 'idx_inventory_product');
+
+DROP PROCEDURE create_index_if_missing;
+DROP PROCEDURE drop_index_if_exists;
+
+ANALYZE TABLE Orders, Involvement, Inventory, Order_Placed;
+
+SELECT 'Covering indexes in place' AS Status;
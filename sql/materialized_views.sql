@@ -0,0 +1,282 @@
+-- =====================================================
+-- Materialized Analytics Tables
+-- Pharmaceutical Supply Chain Analytics
+-- Database: MySQL 8.0+
+--
+-- Pre-aggregated roll-up tables read by the Python analytics
+-- platform instead of re-running the multi-table joins on every
+-- dashboard or report. Run after create_tables.sql:
+--     mysql -u root -p pharma_db < sql/materialized_views.sql
+-- =====================================================
+
+USE pharma_db;
+
+DROP EVENT IF EXISTS refresh_materialized_views_hourly;
+DROP PROCEDURE IF EXISTS refresh_materialized_views;
+DROP TABLE IF EXISTS mv_sales_performance;
+DROP TABLE IF EXISTS mv_inventory_status;
+DROP TABLE IF EXISTS mv_regional_performance;
+DROP TABLE IF EXISTS mv_customer_segments;
+DROP TABLE IF EXISTS mv_product_performance;
+
+-- =====================================================
+-- ROLL-UP TABLES
+-- =====================================================
+
+-- Sales performance by representative
+CREATE TABLE mv_sales_performance (
+    Representative_ID INT PRIMARY KEY NOT NULL,
+    Representative_Name VARCHAR(100) NOT NULL,
+    Region_Name VARCHAR(100) NOT NULL,
+    Performance_Rating DECIMAL(3,2),
+    Total_Orders INT NOT NULL DEFAULT 0,
+    Total_Sales DECIMAL(14, 2),
+    Average_Order_Value DECIMAL(14, 6),
+    Unique_Customers INT NOT NULL DEFAULT 0,
+    Last_Order_Date DATE,
+    INDEX idx_mv_sales_total (Total_Sales)
+);
+
+-- Inventory status with stock level classifications
+CREATE TABLE mv_inventory_status (
+    Inventory_ID INT PRIMARY KEY NOT NULL,
+    Product_Name VARCHAR(100) NOT NULL,
+    Category VARCHAR(100) NOT NULL,
+    Price DECIMAL(10, 2) NOT NULL,
+    Current_Stock INT NOT NULL,
+    Reorder_Level INT,
+    Total_Value DECIMAL(14, 2),
+    Location VARCHAR(100),
+    -- 0 OUT_OF_STOCK, 1 CRITICAL, 2 LOW, 3 MODERATE, 4 ADEQUATE
+    Stock_Status_Code TINYINT UNSIGNED NOT NULL,
+    Action_Required VARCHAR(20) NOT NULL,
+    INDEX idx_mv_inventory_status (Stock_Status_Code, Total_Value)
+);
+
+-- Regional performance roll-up
+CREATE TABLE mv_regional_performance (
+    Region_ID INT PRIMARY KEY NOT NULL,
+    Region_Name VARCHAR(100) NOT NULL,
+    Total_Representatives INT NOT NULL,
+    Total_Orders INT NOT NULL DEFAULT 0,
+    Total_Revenue DECIMAL(14, 2),
+    Average_Order_Value DECIMAL(14, 6),
+    Unique_Customers INT NOT NULL DEFAULT 0,
+    Revenue_Per_Rep DECIMAL(14, 6),
+    Orders_Per_Rep DECIMAL(10, 4)
+);
+
+-- Customer segments by customer type
+CREATE TABLE mv_customer_segments (
+    Customer_Type VARCHAR(20) PRIMARY KEY NOT NULL,
+    Customer_Count INT NOT NULL,
+    Total_Orders INT NOT NULL DEFAULT 0,
+    Total_Revenue DECIMAL(14, 2),
+    Average_Order_Value DECIMAL(14, 6),
+    Revenue_Per_Customer DECIMAL(14, 6)
+);
+
+-- Product performance; stock is summed across inventory locations
+CREATE TABLE mv_product_performance (
+    Product_ID INT PRIMARY KEY NOT NULL,
+    Product_Name VARCHAR(100) NOT NULL,
+    Category VARCHAR(100) NOT NULL,
+    Unit_Price DECIMAL(10, 2) NOT NULL,
+    Times_Ordered INT NOT NULL DEFAULT 0,
+    Total_Quantity_Sold INT,
+    Total_Revenue DECIMAL(14, 2),
+    Avg_Quantity_Per_Order DECIMAL(14, 4),
+    Current_Stock INT,
+    Turnover_Ratio DECIMAL(12, 2),
+    INDEX idx_mv_product_revenue (Total_Revenue)
+);
+
+-- =====================================================
+-- REFRESH PROCEDURE
+-- =====================================================
+
+-- Rebuilds every roll-up table inside one transaction so readers
+-- never observe a partially refreshed (or empty) table
+DELIMITER //
+CREATE PROCEDURE refresh_materialized_views()
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+
+    START TRANSACTION;
+
+    -- One pre-aggregated row per representative, shared by the sales and
+    -- regional roll-ups. Orders and interactions are aggregated separately
+    -- before joining so neither multiplies the other's rows
+    DROP TEMPORARY TABLE IF EXISTS t_sales_base;
+    CREATE TEMPORARY TABLE t_sales_base AS
+    SELECT
+        sr.Representative_ID,
+        sr.Region_ID,
+        r.Name AS Region_Name,
+        sr.Name AS Rep_Name,
+        sr.Performance_Rating,
+        COALESCE(o.Total_Orders, 0) AS Total_Orders,
+        o.Total_Sales,
+        o.Average_Order_Value,
+        COALESCE(ic.Unique_Customers, 0) AS Unique_Customers,
+        o.Last_Order_Date
+    FROM Sales_Representative sr
+    JOIN Region r ON sr.Region_ID = r.Region_ID
+    LEFT JOIN (
+        SELECT
+            Representative_ID,
+            COUNT(*) AS Total_Orders,
+            SUM(Total_cost) AS Total_Sales,
+            AVG(Total_cost) AS Average_Order_Value,
+            MAX(Date) AS Last_Order_Date
+        FROM Orders
+        WHERE Order_Status != 'Cancelled'
+        GROUP BY Representative_ID
+    ) o ON sr.Representative_ID = o.Representative_ID
+    -- Interaction is keyed on (Representative_ID, Customer_ID), so the
+    -- row count per representative is the distinct customer count
+    LEFT JOIN (
+        SELECT Representative_ID, COUNT(*) AS Unique_Customers
+        FROM Interaction
+        GROUP BY Representative_ID
+    ) ic ON sr.Representative_ID = ic.Representative_ID;
+
+    DELETE FROM mv_sales_performance;
+    INSERT INTO mv_sales_performance
+    SELECT
+        Representative_ID,
+        Rep_Name AS Representative_Name,
+        Region_Name,
+        Performance_Rating,
+        Total_Orders,
+        Total_Sales,
+        Average_Order_Value,
+        Unique_Customers,
+        Last_Order_Date
+    FROM t_sales_base;
+
+    -- A customer can interact with several representatives in a region,
+    -- so regional unique customers need the one remaining DISTINCT count
+    DELETE FROM mv_regional_performance;
+    INSERT INTO mv_regional_performance
+    SELECT
+        b.Region_ID,
+        b.Region_Name,
+        COUNT(*) AS Total_Representatives,
+        SUM(b.Total_Orders) AS Total_Orders,
+        SUM(b.Total_Sales) AS Total_Revenue,
+        SUM(b.Total_Sales) / NULLIF(SUM(b.Total_Orders), 0) AS Average_Order_Value,
+        COALESCE(MAX(rc.Unique_Customers), 0) AS Unique_Customers,
+        SUM(b.Total_Sales) / COUNT(*) AS Revenue_Per_Rep,
+        SUM(b.Total_Orders) / COUNT(*) AS Orders_Per_Rep
+    FROM t_sales_base b
+    LEFT JOIN (
+        SELECT sr.Region_ID, COUNT(DISTINCT i.Customer_ID) AS Unique_Customers
+        FROM Interaction i
+        JOIN Sales_Representative sr ON i.Representative_ID = sr.Representative_ID
+        GROUP BY sr.Region_ID
+    ) rc ON b.Region_ID = rc.Region_ID
+    GROUP BY b.Region_ID, b.Region_Name;
+
+    DROP TEMPORARY TABLE t_sales_base;
+
+    DELETE FROM mv_inventory_status;
+    INSERT INTO mv_inventory_status
+    SELECT
+        i.Inventory_ID,
+        p.Name AS Product_Name,
+        p.Category,
+        p.Price,
+        i.Quantity AS Current_Stock,
+        i.Reorder_Level,
+        (p.Price * i.Quantity) AS Total_Value,
+        i.Location,
+        CASE
+            WHEN i.Quantity = 0 THEN 0
+            WHEN i.Quantity <= i.Reorder_Level * 0.3 THEN 1
+            WHEN i.Quantity <= i.Reorder_Level * 0.6 THEN 2
+            WHEN i.Quantity <= i.Reorder_Level THEN 3
+            ELSE 4
+        END AS Stock_Status_Code,
+        CASE
+            WHEN i.Quantity <= i.Reorder_Level THEN 'REORDER_NOW'
+            WHEN i.Quantity <= i.Reorder_Level * 1.5 THEN 'MONITOR'
+            ELSE 'SUFFICIENT'
+        END AS Action_Required
+    FROM Product p
+    JOIN Inventory i ON p.Product_ID = i.Product_ID;
+
+    DELETE FROM mv_customer_segments;
+    INSERT INTO mv_customer_segments
+    SELECT
+        c.Customer_Type,
+        COUNT(*) AS Customer_Count,
+        COALESCE(SUM(co.Order_Count), 0) AS Total_Orders,
+        SUM(co.Revenue) AS Total_Revenue,
+        SUM(co.Revenue) / NULLIF(SUM(co.Order_Count), 0) AS Average_Order_Value,
+        SUM(co.Revenue) / COUNT(*) AS Revenue_Per_Customer
+    FROM Customer c
+    LEFT JOIN (
+        SELECT op.Customer_ID, COUNT(*) AS Order_Count, SUM(o.Total_cost) AS Revenue
+        FROM Order_Placed op
+        JOIN Orders o ON op.Order_ID = o.Order_ID
+        WHERE o.Order_Status != 'Cancelled'
+        GROUP BY op.Customer_ID
+    ) co ON c.Customer_ID = co.Customer_ID
+    GROUP BY c.Customer_Type;
+
+    DELETE FROM mv_product_performance;
+    INSERT INTO mv_product_performance
+    SELECT
+        p.Product_ID,
+        p.Name AS Product_Name,
+        p.Category,
+        p.Price AS Unit_Price,
+        COALESCE(s.Times_Ordered, 0) AS Times_Ordered,
+        s.Total_Quantity_Sold,
+        s.Total_Revenue,
+        s.Avg_Quantity_Per_Order,
+        st.Current_Stock,
+        CASE
+            WHEN st.Current_Stock > 0 AND s.Total_Quantity_Sold > 0
+            THEN ROUND(s.Total_Quantity_Sold / st.Current_Stock, 2)
+            ELSE 0
+        END AS Turnover_Ratio
+    FROM Product p
+    -- Sales and stock are aggregated per product before joining, so
+    -- neither is repeated once per row of the other
+    LEFT JOIN (
+        SELECT
+            inv.Product_ID,
+            COUNT(*) AS Times_Ordered,
+            SUM(inv.Quantity_Ordered) AS Total_Quantity_Sold,
+            SUM(inv.Line_Total) AS Total_Revenue,
+            AVG(inv.Quantity_Ordered) AS Avg_Quantity_Per_Order
+        FROM Involvement inv
+        JOIN Orders o ON inv.Order_ID = o.Order_ID
+        WHERE o.Order_Status != 'Cancelled'
+        GROUP BY inv.Product_ID
+    ) s ON p.Product_ID = s.Product_ID
+    LEFT JOIN (
+        SELECT Product_ID, SUM(Quantity) AS Current_Stock
+        FROM Inventory
+        GROUP BY Product_ID
+    ) st ON p.Product_ID = st.Product_ID;
+
+    COMMIT;
+END //
+DELIMITER ;
+
+-- Initial population
+CALL refresh_materialized_views();
+
+-- Scheduled refresh (requires SET GLOBAL event_scheduler = ON)
+CREATE EVENT refresh_materialized_views_hourly
+ON SCHEDULE EVERY 1 HOUR
+DO CALL refresh_materialized_views();
+
+SELECT 'Materialized views created successfully!' AS Status;